@@ -1 +1 @@
-__all__ = ["orderly","combin","graph","draw"]
+__all__ = ["orderly","combin","graph","draw","properties","shard","sampling","catalog","formats","tables"]
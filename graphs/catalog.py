@@ -0,0 +1,172 @@
+"""
+Ranking and unranking of graphs in the order generated by 'orderly.unlabeled'.
+
+The catalog over n vertices lists the canonical graphs by increasing edge
+count, and within an edge count by decreasing code. An index file records the
+catalog once so that the k-th graph, or the position of a graph, can be found
+without generating the graphs before it:
+
+    header:  'GIDX', version, n, record width w (bytes)
+    counts:  the number of graphs with 0, 1, ..., n(n-1)/2 edges
+    records: the code of every graph in catalog order, w bytes each, big endian
+
+'unrank' reads record k directly. 'rank' binary searches the records of the
+graph's edge count, which are sorted and located by the running totals of the
+counts.
+
+Limits:
+
+[Size] Every code is stored, so the file grows with the catalog:
+    ceil(n(n-1)/16) bytes per graph, e.g. about 1.4 MB for n=9, 72 MB for n=10
+    and 7 GB for n=11. Only the layer counts are small.
+
+[Rank] The binary search is logarithmic only once g is in its canonical
+    labelling. Graphs from 'unrank' or 'orderly.unlabeled' already are and
+    are found directly. Any other labelling is first passed through
+    'orderly.canonical_form', which tries all n! permutations (from the
+    precomputed tables up to tables.LIMIT vertices, one by one above that).
+"""
+
+import binascii
+import struct
+import graph
+import orderly
+
+MAGIC = 'GIDX'
+VERSION = 1
+
+_HEADER = '>4sBBH'
+
+# path -> Catalog, so repeated lookups by path reuse the open file
+_open = {}
+
+
+# =============================================================================
+def build_index(vertices, path):
+    """
+    Enumerates the graphs on the given number of vertices once with
+    'orderly.unlabeled_by_edge_count' and writes their index file.
+
+    :param vertices: The number of vertices for which to generate unlabeled graphs over.
+
+    :param path: The file to write
+    """
+    # a catalog opened on the old file would keep its counts and file handle
+    if path in _open:
+        _open.pop(path).close()
+
+    complete = vertices * (vertices - 1) / 2
+    width = max(1, (complete + 7) / 8)
+    counts = [0] * (complete + 1)
+
+    f = open(path, 'wb')
+    f.write(struct.pack(_HEADER, MAGIC, VERSION, vertices, width))
+    f.write(struct.pack('>%dQ' % len(counts), *counts))
+    for Lm in orderly.unlabeled_by_edge_count(vertices):
+        counts[graph.edgecount(Lm[0])] = len(Lm)
+        for g in Lm:
+            f.write(binascii.unhexlify('%0*x' % (2 * width, orderly.code(g))))
+    f.seek(struct.calcsize(_HEADER))
+    f.write(struct.pack('>%dQ' % len(counts), *counts))
+    f.close()
+
+
+# =============================================================================
+class Catalog:
+    "An open index file written by build_index"
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        magic, version, self.vertices, self.width = struct.unpack(
+            _HEADER, self.file.read(struct.calcsize(_HEADER)))
+        if magic != MAGIC or version != VERSION:
+            raise Exception("Invalid catalog index file: " + path)
+        complete = self.vertices * (self.vertices - 1) / 2
+        self.counts = list(struct.unpack('>%dQ' % (complete + 1), self.file.read(8 * (complete + 1))))
+        self.base = self.file.tell()
+
+        # starts[m] is the position of the first graph with m edges
+        self.starts = [0]
+        for c in self.counts:
+            self.starts.append(self.starts[-1] + c)
+
+    def __len__(self):
+        return self.starts[-1]
+
+    def close(self):
+        self.file.close()
+
+    def _code(self, k):
+        """Reads the code of the graph at position k"""
+        self.file.seek(self.base + k * self.width)
+        return int(binascii.hexlify(self.file.read(self.width)), 16)
+
+    def _find(self, edges, value):
+        """Returns the position of the code value among the graphs with the given edge count, or None"""
+        lo = self.starts[edges]
+        hi = self.starts[edges + 1]
+        # codes decrease with position
+        while lo < hi:
+            mid = (lo + hi) / 2
+            if self._code(mid) > value:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.starts[edges + 1] and self._code(lo) == value:
+            return lo
+        return None
+
+    def unrank(self, k):
+        """Returns the graph at position k of the catalog"""
+        if k < 0 or k >= len(self):
+            raise IndexError("Catalog position out of range: " + str(k))
+        return orderly.decode(self.vertices, self._code(k))
+
+    def rank(self, g):
+        """Returns the position of g's isomorphism class in the catalog"""
+        if len(g) != self.vertices:
+            raise ValueError("Graph has " + str(len(g)) + " vertices, catalog has " + str(self.vertices))
+        edges = graph.edgecount(g)
+        # Only canonical codes are recorded, so a match means g is already canonical
+        k = self._find(edges, orderly.code(g))
+        if k is None:
+            k = self._find(edges, orderly.code(orderly.canonical_form(g)))
+        if k is None:
+            raise ValueError("Graph not found in catalog")
+        return k
+
+
+# =============================================================================
+def _catalog(index):
+    if isinstance(index, Catalog):
+        return index
+    if index not in _open:
+        _open[index] = Catalog(index)
+    return _open[index]
+
+
+def rank(g, index):
+    """
+    Returns the position of g's isomorphism class in the catalog over its vertices.
+
+    :param g: A dict which maps vertex numbers to adjacency lists.
+
+    :param index: A Catalog or the path of an index file written by build_index
+    """
+    return _catalog(index).rank(g)
+
+
+def unrank(vertices, k, index):
+    """
+    Returns the graph at position k of the catalog over the given number of vertices.
+
+    :param vertices: The number of vertices, which must match the index
+
+    :param k: A position, 0 <= k < len(catalog)
+
+    :param index: A Catalog or the path of an index file written by build_index
+    """
+    catalog = _catalog(index)
+    if catalog.vertices != vertices:
+        raise ValueError("Index is for " + str(catalog.vertices) + " vertices, not " + str(vertices))
+    return catalog.unrank(k)
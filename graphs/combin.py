@@ -4,8 +4,7 @@ Some combinatorics functions
 
 __author__ = "Ryan Anderson"
 
-from math import *
-from fractions import gcd
+from math import factorial
 
 def all_permutations(l):
     """Generator: generates all permutations on the given list of objects"""
@@ -17,6 +16,12 @@ def all_permutations(l):
                 yield p[:i] + l[0:1] + p[i:]
 
 
+def gcd(a,b):
+    """Returns the greatest common divisor of a and b"""
+    while b:
+        a, b = b, a % b
+    return a
+
 def lcm(a,b):
     """Returns the least common multiple of a and b"""
     if a == 0 or b == 0:
@@ -133,26 +138,55 @@ def print_int_part(n):
         i.sort()
         print i
 
+def cycle_type_size(p):
+    """
+    Returns the number of permutations of sum(p) objects whose cycle lengths
+    are the partition p.
+    """
+    size = factorial(sum(p))
+    for i in set(p):
+        c = p.count(i)
+        size /= i ** c * factorial(c)
+    return size
+
+def edge_orbits(p):
+    """
+    A permutation of the vertices with cycle lengths p also permutes the pairs
+    of vertices. Returns a dict which maps each cycle length of the permutation
+    on pairs to the number of cycles of that length.
+
+    A pair inside one vertex cycle of length k lies on a pair cycle of length
+    k, except that when k is even the k/2 antipodal pairs form one cycle of
+    length k/2. Pairs between two vertex cycles of lengths a and b form
+    gcd(a,b) cycles of length lcm(a,b).
+    """
+    orbits = {}
+    for x in range(len(p)):
+        k = p[x]
+        if k % 2 == 1:
+            orbits[k] = orbits.get(k, 0) + (k - 1) / 2
+        else:
+            orbits[k] = orbits.get(k, 0) + (k - 2) / 2
+            orbits[k / 2] = orbits.get(k / 2, 0) + 1
+        for y in range(x + 1, len(p)):
+            orbits[lcm(k, p[y])] = orbits.get(lcm(k, p[y]), 0) + gcd(k, p[y])
+    for length in orbits.keys():
+        if orbits[length] == 0:
+            del orbits[length]
+    return orbits
+
 def num_isomorphism_classes(n):
     """
     Calculates the total number of isomorphism classes in the
     set of graphs of n vertices. Uses the partition generator
-    and Cycle Index polynomial Z.
+    and Cycle Index polynomial Z: by Burnside's lemma it is the
+    average over all vertex permutations of the number of graphs
+    they fix, and a permutation fixes 2^(number of pair cycles) graphs.
     """
-    f = factorial(n)
     terms = 0
 
-    #for each way to partition n objects, generate a monomial of Z	
+    #for each way to partition n objects, add the monomial of Z evaluated at 2
     for p in gen_partitions(n):
-        coef = 1
-        monomial = 1
-        for i in range( 1, n+1, 1 ):
-            c = p.count(i)
-            if( c > 0 ):
-                coef *= int((factorial(c)*(pow(i,c))))
-                monomial *= int(pow(n,c))
-        terms += coef*monomial
-
-    return int(terms/f)
-			
-		
+        terms += cycle_type_size(p) * 2 ** sum(edge_orbits(p).values())
+
+    return terms / factorial(n)
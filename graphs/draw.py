@@ -4,13 +4,6 @@ __author__ = "Ryan Anderson"
 
 from graph import *
 
-hasPIL = True
-
-try:
-    from PIL import Image, ImageDraw
-except:
-    hasPIL = False
-
 
 def drawGraph( graph, xy, image ):
     """Draws a graph where the vertices are distributed on a 
@@ -18,7 +11,11 @@ def drawGraph( graph, xy, image ):
     is a square whose upper left corner is x,y, and whose
     width & height is 'length' """
 
-    if not hasPIL:
+    # PIL is imported here rather than with the module: it is slow to import
+    # and nothing else needs it
+    try:
+        from PIL import ImageDraw
+    except ImportError:
         print("Python image library not installed. Please install to use this function")
         return False
 
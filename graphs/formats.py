@@ -0,0 +1,67 @@
+"""
+Encodings for writing graphs out.
+
+Each encoder takes a graph (a dict which maps vertex numbers to adjacency
+lists) and returns a string holding one complete record.
+"""
+
+import binascii
+import graph
+import orderly
+import tables
+
+
+# =============================================================================
+def text(g):
+    """The graph's dict as printed by python, one per line"""
+    return str(g) + '\n'
+
+
+def graph6(g):
+    """
+    The graph6 format of nauty (one printable line per graph). The vertices
+    are taken in the order of g.keys().
+    """
+    vertices = g.keys()
+    n = len(vertices)
+    if n < 63:
+        out = [chr(63 + n)]
+    else:
+        out = [chr(126)] + [chr(63 + ((n >> s) & 63)) for s in (12, 6, 0)]
+
+    if isinstance(g, graph.ComplementView):
+        # read the bits of the view's code instead of building its adjacency
+        shifts = tables.pairs(n)[1]
+        adjacent = lambda i, j: (g.code >> shifts[i][j]) & 1
+    else:
+        adjacent = lambda i, j: vertices[i] in g[vertices[j]]
+
+    # upper triangle, column by column, six bits per character
+    value = 0
+    bits = 0
+    for j in range(1, n):
+        for i in range(j):
+            value = (value << 1) | adjacent(i, j)
+            bits += 1
+            if bits == 6:
+                out.append(chr(63 + value))
+                value = 0
+                bits = 0
+    if bits > 0:
+        out.append(chr(63 + (value << (6 - bits))))
+    out.append('\n')
+    return ''.join(out)
+
+
+def binary(g):
+    """The graph's code (see 'orderly.code') as a fixed width, big endian record of ceil(n(n-1)/16) bytes"""
+    n = len(g)
+    width = max(1, (n * (n - 1) / 2 + 7) / 8)
+    return binascii.unhexlify('%0*x' % (2 * width, orderly.code(g)))
+
+
+ENCODERS = {
+    'text': text,
+    'graph6': graph6,
+    'binary': binary,
+}
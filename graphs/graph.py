@@ -9,6 +9,7 @@ adjacency list of node numbers.
 __author__ = "Ryan Anderson"
 
 import math
+import tables
 
 def isAdj(graph, i, j):
     """returns true if vertices i and j are adjacent (Undirected)"""
@@ -18,6 +19,8 @@ def isAdj(graph, i, j):
 
 def edgecount(graph):
     """ Returns the number of edges in the graph"""
+    if isinstance(graph, ComplementView):
+        return graph.edgecount()
     count = 0
     for node in graph.keys():
         count += len( graph[node] )
@@ -74,6 +77,78 @@ def complement(graph):
                 comp[n].append(e)
     return comp
 
+class ComplementView:
+    '''A read-only view of the complement of a graph, given by the code of the original
+    (see orderly.code) and nothing else. Complementing flips every bit of a code, so the
+    view's own code is (2^C(n,2) - 1) XOR that code and its adjacency, degrees and edge
+    count are read off those bits. No dict of lists is built unless materialize() is called.
+
+    The view is labelled 1..n in the labelling that gave the original its code. Passing
+    the original's minimum code over all permutations therefore gives the complement in
+    its canonical (maximum code) labelling, which is what unlabeled_complement does.
+
+    Adjacency lists are returned as tuples so that an attempt to add an edge fails
+    instead of silently changing a copy.'''
+
+    def __init__(self, vertices, code):
+        self.vertices = vertices
+        complete = vertices * (vertices - 1) / 2
+        self.code = ((1 << complete) - 1) ^ code
+        self._rows = None
+
+    def keys(self):
+        return range(1, self.vertices + 1)
+
+    def __iter__(self):
+        return iter(range(1, self.vertices + 1))
+
+    def __len__(self):
+        return self.vertices
+
+    def __contains__(self, v):
+        return 1 <= v <= self.vertices
+
+    def _row(self, v):
+        '''The neighbours of v, read from the bits of the code'''
+        shifts = tables.pairs(self.vertices)[1][v - 1]
+        code = self.code
+        return tuple([u for u in range(1, self.vertices + 1) if u != v and (code >> shifts[u - 1]) & 1])
+
+    def __getitem__(self, v):
+        if v not in self:
+            raise KeyError(v)
+        if self._rows is None:
+            self._rows = [self._row(u) for u in range(1, self.vertices + 1)]
+        return self._rows[v - 1]
+
+    def degree(self, v):
+        return len(self[v])
+
+    def edgecount(self):
+        return bin(self.code).count('1')
+
+    def materialize(self):
+        '''Returns the complement as an ordinary dict of lists'''
+        g = {}
+        for v in range(1, self.vertices + 1):
+            g[v] = list(self[v])
+        return g
+
+    def __eq__(self, other):
+        if isinstance(other, ComplementView):
+            return self.vertices == other.vertices and self.code == other.code
+        return self.materialize() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        # the same text as the repr of the materialized dict, straight from the bits
+        rows = []
+        for v in range(1, self.vertices + 1):
+            rows.append('%d: [%s]' % (v, ', '.join([str(u) for u in self._row(v)])))
+        return '{' + ', '.join(rows) + '}'
+
 def relabel(graph, v1, v2):
     '''Re-label's v1 as v2. If v2 exists in the graph, v2 is renamed to v1'''
     if v1 not in graph:
@@ -6,8 +6,10 @@ __author__ = "Ryan Anderson"
 __status__ = "development"
 
 from copy import deepcopy
+import sys
 import combin
 import graph
+import tables
 
 # =============================================================================
 def augmenter(g):
@@ -28,6 +30,35 @@ def augmenter(g):
             yield new_graph
 
 
+# =============================================================================
+def orderly_augmenter(g):
+    """
+    A python generator which adds a single edge to g in only those positions
+    which come after every existing edge in the order of the code's bits
+    (i.e. a 0 to the right of the last 1 becomes a 1). The augmentations are
+    generated in decreasing order of code.
+
+    Removing the last edge of a canonical graph leaves a canonical graph, so
+    every canonical graph is generated by this augmenter from exactly one
+    canonical parent. Unlike 'augmenter', no comparison against previously
+    generated graphs is needed, which makes subtrees of different parents
+    independent of each other.
+
+    :param g: A dict which maps vertex numbers to adjacency lists.
+    """
+
+    pairs = list(combin.k_combinations(g.keys(), 2))
+    last = -1
+    for i in range(len(pairs)):
+        if graph.isAdj(g, pairs[i][0], pairs[i][1]):
+            last = i
+    for pair in pairs[last + 1:]:
+        new_graph = deepcopy(g)
+        new_graph[pair[0]].append(pair[1])
+        new_graph[pair[1]].append(pair[0])
+        yield new_graph
+
+
 # =============================================================================
 def code(g, permutation=None):
     """
@@ -50,17 +81,81 @@ def code(g, permutation=None):
     """
 
     if permutation is None:
+        if isinstance(g, graph.ComplementView):
+            return g.code
         permutation = g.keys()
 
-    bits = ""
+    # position of each vertex in the permutation
+    where = {}
     for i in range(len(permutation)):
-        for j in range(len(permutation)):
-            if j > i:
-                if graph.isAdj(g, permutation[i], permutation[j]):
-                    bits += "1"
-                else:
-                    bits += "0"
-    return int(bits, 2)
+        where[permutation[i]] = i
+
+    shifts = tables.pairs(len(permutation))[1]
+    value = 0
+    for v in permutation:
+        for u in g[v]:
+            value |= 1 << shifts[where[v]][where[u]]
+    return value
+
+
+# =============================================================================
+def all_codes(g):
+    """
+    A generator which yields the code of g under every permutation of its
+    vertices. Up to tables.LIMIT vertices this reads the precomputed
+    permutation maps instead of relabelling the graph for each permutation.
+
+    :param g: A dict which maps vertex numbers to adjacency lists.
+    """
+    n = len(g)
+    if n > tables.LIMIT:
+        for perm in combin.all_permutations(g.keys()):
+            yield code(g, perm)
+        return
+
+    vertices = g.keys()
+    where = {}
+    for i in range(n):
+        where[vertices[i]] = i
+    complete = n * (n - 1) / 2
+    shifts = tables.pairs(n)[1]
+    edges = []
+    for v in vertices:
+        for u in g[v]:
+            if where[v] < where[u]:
+                edges.append(complete - 1 - shifts[where[v]][where[u]])
+
+    for m in tables.permutation_maps(n):
+        value = 0
+        for e in edges:
+            value |= 1 << m[e]
+        yield value
+
+
+# =============================================================================
+def decode(vertices, value):
+    """
+    The inverse of 'code': builds the graph on vertices 1..n whose code (under
+    the identity permutation) is value.
+
+    :param vertices: The number of vertices in the graph.
+
+    :param value: A code as returned by 'code'
+
+    :return: A dict which maps vertex numbers to adjacency lists.
+    """
+
+    g = {}
+    for i in range(1, vertices + 1, 1):
+        g[i] = []
+    bit = vertices * (vertices - 1) / 2
+    for i in range(1, vertices + 1, 1):
+        for j in range(i + 1, vertices + 1, 1):
+            bit -= 1
+            if (value >> bit) & 1:
+                g[i].append(j)
+                g[j].append(i)
+    return g
 
 
 # =============================================================================
@@ -68,30 +163,60 @@ def is_canonical(g):
     """
     This is where improvements will probably have the greatest effect. 
     Checks to see whether or not the graph's code represents the canonical 
-    labelling for its isomorphism class. It does this by finding the 
-    maximum code over all permutations of the vertices.
+    labelling for its isomorphism class. It does this by comparing its code
+    with the code under every permutation of the vertices, stopping at the
+    first one which is larger.
 
     :param g: A dict which maps vertex numbers to adjacency lists.
 
     :return: True if the code of g is the maximum over all permutations of g's
     vertices. False otherwise
     """
-    start_list = g.keys()
     test_code = code(g)
 
-    max = 0
-    for perm in combin.all_permutations(start_list):
-        cur_code = code(g, perm)
-        if (cur_code > max):
-            max = cur_code
-    # print "Max: (canonical): " + str(max)
-    if (test_code == max):
-        return True
-    else:
-        return False
+    for cur_code in all_codes(g):
+        if (cur_code > test_code):
+            return False
+    return True
+
+
+def canonical_min_code(g):
+    """
+    Does the work of 'is_canonical' and also finds the minimum code of g over
+    all permutations of its vertices, which is the mask of the canonical code
+    of g's complement (see graph.ComplementView).
+
+    :param g: A dict which maps vertex numbers to adjacency lists.
+
+    :return: None if g is not canonical, otherwise its minimum code
+    """
+    test_code = code(g)
+    low = test_code
+
+    for cur_code in all_codes(g):
+        if (cur_code > test_code):
+            return None
+        if (cur_code < low):
+            low = cur_code
+    return low
+
+# =============================================================================
+def canonical_form(g):
+    """
+    Relabels g so that its code is the maximum over all permutations of its
+    vertices, i.e. returns the graph of g's isomorphism class which
+    'is_canonical' accepts. Like 'is_canonical' this tries every permutation,
+    so it is only practical for small graphs.
+
+    :param g: A dict which maps vertex numbers to adjacency lists.
+
+    :return: A dict which maps the vertex numbers 1..n to adjacency lists.
+    """
+    return decode(len(g), max(all_codes(g)))
+
 
 # =============================================================================
-def unlabeled(vertices):
+def unlabeled(vertices, hereditary=None, emit=None):
     """
     A generator which generates all unlabeled (structurally different) graphs with a given number of vertices.
 
@@ -99,51 +224,115 @@ def unlabeled(vertices):
     R. C. Read, Everyone a Winner or How to Avoid Isomorphism When Cataloging Combinatorial Configurations, Annals of
     Discrete Mathematics 2 (1978) 107-120
 
+    The generated class can be restricted with the predicates in 'properties'. A graph that fails the hereditary
+    property is dropped before its canonicity is tested and is never augmented, so the whole branch above it is cut.
+    The emit property is only tested on graphs about to be yielded and does not prune.
+
     :param vertices: The number of vertices for which to generate unlabeled graphs over.
+
+    :param hereditary: Optional property which is preserved under edge removal (e.g. properties.max_degree(3))
+
+    :param emit: Optional property which every yielded graph must satisfy (e.g. properties.connected)
     """
     g0 = {}
     complete = vertices * (vertices - 1) / 2
 
     for i in range(1, vertices + 1, 1):
         g0[i] = []
-    yield g0
+    if hereditary is not None and not hereditary(g0):
+        return
+    if emit is None or emit(g0):
+        yield g0
     Lm = [g0]
-    while graph.edgecount(Lm[0]) < complete:
+    while len(Lm) > 0 and graph.edgecount(Lm[0]) < complete:
         L = []
         for g in Lm:
             for trial in augmenter(g):
+                if hereditary is not None and not hereditary(trial):
+                    continue
                 if len(L) > 0:
                     if code(trial) < code(L[-1]) and is_canonical(trial) == True:
                         L.append(trial)
-                        yield (L[-1])
+                        if emit is None or emit(L[-1]):
+                            yield (L[-1])
                 elif is_canonical(trial) == True:
                     L.append(trial)
-                    yield (L[-1])
+                    if emit is None or emit(L[-1]):
+                        yield (L[-1])
         Lm = L
         L = []
 
 
 # =============================================================================
-def unlabeled_by_edge_count(vertices):
+def unlabeled_by_edge_count(vertices, hereditary=None, emit=None):
+    """
+    A generator which yields the unlabeled graphs with a given number of vertices as one list per edge count,
+    starting with the empty graph. Each list is in decreasing order of code.
+
+    :param vertices: The number of vertices for which to generate unlabeled graphs over.
+
+    :param hereditary: Optional property which is preserved under edge removal, see 'unlabeled'
+
+    :param emit: Optional property which every graph in a yielded list must satisfy, see 'unlabeled'
+    """
     g0 = {}
     complete = vertices * (vertices - 1) / 2
 
     for i in range(1, vertices + 1, 1):
         g0[i] = []
+    if hereditary is not None and not hereditary(g0):
+        return
     Lm = [g0]
-    yield Lm
+    if emit is None:
+        yield Lm
+    else:
+        yield [g for g in Lm if emit(g)]
     while graph.edgecount(Lm[0]) < complete:
         L = []
         for g in Lm:
             for trial in augmenter(g):
+                if hereditary is not None and not hereditary(trial):
+                    continue
                 if len(L) > 0:
                     # print "code trial(" + str(code(trial)) + "), code L[-1] (" + str(code( (L[-1])))
                     if code(trial) < code(L[-1]) and is_canonical(trial) == True:
                         L.append(trial)
                 elif is_canonical(trial):
                     L.append(trial)
+        if len(L) == 0:
+            return
         Lm = L
+        if emit is None:
+            yield Lm
+        else:
+            yield [g for g in Lm if emit(g)]
+
+
+# =============================================================================
+def unlabeled_from(roots, hereditary=None):
+    """
+    A generator which yields, one list per edge count, the canonical graphs descending from the given roots using
+    'orderly_augmenter'. The first list yielded is roots itself. If the roots all have the same number of edges and
+    are in decreasing order of code, so is every list yielded.
+
+    Starting from the empty graph this yields the same lists as 'unlabeled_by_edge_count'. Starting from a subset of
+    one of those lists it yields exactly the graphs of the later lists which descend from that subset.
+
+    :param roots: A list of canonical graphs on the same vertices.
+
+    :param hereditary: Optional property which is preserved under edge removal, see 'unlabeled'
+    """
+    Lm = roots
+    while len(Lm) > 0:
         yield Lm
+        L = []
+        for g in Lm:
+            for trial in orderly_augmenter(g):
+                if hereditary is not None and not hereditary(trial):
+                    continue
+                if is_canonical(trial):
+                    L.append(trial)
+        Lm = L
 
 
 # =============================================================================
@@ -157,6 +346,9 @@ def unlabeled_complement(vertices):
     the complement of all graphs in the first half. The complement in this case simply meaning: "for every pair of
     vertices with an edge, remove that edge and for every pair of vertices with no edge, add an edge."
 
+    The complements are yielded as graph.ComplementView objects built from the minimum code of the first half graph,
+    so they are in their canonical labelling like every other graph yielded and no dict of lists is built for them.
+
     :param vertices: The number of vertices for which to generate unlabeled graphs over.
     """
 
@@ -165,7 +357,7 @@ def unlabeled_complement(vertices):
     edgeclasses = vertices * (vertices - 1) / 2 + 1
     firsthalf = edgeclasses / 2
     odd = edgeclasses % 2
-    print "graphs complement: odd=", odd, "max edges: ", edgeclasses - 1
+    print >> sys.stderr, "graphs complement: odd=", odd, "max edges: ", edgeclasses - 1
 
     # initialize the first graph with the number of vertices but no edges
     for i in range(1, vertices + 1, 1):
@@ -173,7 +365,7 @@ def unlabeled_complement(vertices):
 
     # yield the first graph, then yield it's compliment
     yield g0
-    yield graph.complement(g0)
+    yield graph.ComplementView(vertices, 0)
 
     # Start with a list on m (in this case 0) edges.
     Lm = [g0]
@@ -187,16 +379,14 @@ def unlabeled_complement(vertices):
         for g in Lm:
             # for each graph generated by adding a single edge
             for trial in augmenter(g):
-                if len(L) > 0:
-                    if code(trial) < code(L[-1]) and is_canonical(trial) == True:
-                        L.append(trial)
-                        yield (L[-1])
-                        yield (graph.complement(L[-1]))
-                elif is_canonical(trial) == True:
+                if len(L) > 0 and code(trial) >= code(L[-1]):
+                    continue
+                low = canonical_min_code(trial)
+                if low is not None:
                     L.append(trial)
                     yield (L[-1])
-                    yield (graph.complement(L[-1]))
-        print "Generating: graphs on", graph.edgecount(Lm[0]) + 1, "edges(" + str(len(L)) + ")"
+                    yield (graph.ComplementView(vertices, low))
+        print >> sys.stderr, "Generating: graphs on", graph.edgecount(Lm[0]) + 1, "edges(" + str(len(L)) + ")"
 
         Lm = L
         L = []
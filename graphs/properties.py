@@ -0,0 +1,155 @@
+"""
+Graph properties for restricting the classes generated in 'orderly'.
+
+Every property is a predicate which takes a graph (a dict which maps vertex
+numbers to adjacency lists) and returns True if the graph belongs to the class.
+
+Properties come in two kinds:
+
+[Hereditary] The property is preserved when an edge is removed (max degree,
+    triangle-free, bipartite, girth, clique number, ...). The orderly
+    generators only ever add edges, so once a partial graph violates a
+    hereditary property none of its descendants can satisfy it and the whole
+    branch is cut. Pass these as the 'hereditary' argument of a generator.
+
+[Non-hereditary] Anything else (connectivity, ...). These are only tested
+    on the graphs about to be emitted and never prune. Pass these as the
+    'emit' argument of a generator.
+"""
+
+import combin
+
+
+# =============================================================================
+def all_of(*properties):
+    """
+    Returns a property which holds when every one of the given properties
+    holds. If every property is hereditary, so is the result.
+    """
+
+    def check(g):
+        for p in properties:
+            if not p(g):
+                return False
+        return True
+    return check
+
+
+# =============================================================================
+def max_degree(d):
+    """Hereditary: returns a property which holds when no vertex has degree greater than d."""
+
+    def check(g):
+        for v in g:
+            if len(g[v]) > d:
+                return False
+        return True
+    return check
+
+
+# =============================================================================
+def girth(g):
+    """
+    Returns the length of the shortest cycle in g, or None if g is acyclic.
+    A breadth first search is run from every vertex and every non-tree edge
+    closes a walk through the root; the shortest of these over all roots is
+    the girth.
+    """
+
+    best = None
+    for root in g:
+        depth = {root: 0}
+        parent = {root: None}
+        queue = [root]
+        for v in queue:
+            if best is not None and 2 * depth[v] >= best:
+                break
+            for u in g[v]:
+                if u not in depth:
+                    depth[u] = depth[v] + 1
+                    parent[u] = v
+                    queue.append(u)
+                elif parent[v] != u:
+                    length = depth[u] + depth[v] + 1
+                    if best is None or length < best:
+                        best = length
+    return best
+
+
+def min_girth(k):
+    """Hereditary: returns a property which holds when g has no cycle shorter than k."""
+
+    def check(g):
+        shortest = girth(g)
+        return shortest is None or shortest >= k
+    return check
+
+
+def acyclic(g):
+    """Hereditary: True if g is a forest."""
+    return girth(g) is None
+
+
+def triangle_free(g):
+    """Hereditary: True if g contains no triangle."""
+    for v in g:
+        for u in g[v]:
+            if u > v:
+                for w in g[u]:
+                    if w > u and w in g[v]:
+                        return False
+    return True
+
+
+# =============================================================================
+def max_clique(k):
+    """Hereditary: returns a property which holds when the clique number of g is at most k."""
+
+    def check(g):
+        if k >= len(g):
+            return True
+        for c in combin.k_combinations(g.keys(), k + 1):
+            clique = True
+            for pair in combin.k_combinations(c, 2):
+                if pair[0] not in g[pair[1]]:
+                    clique = False
+                    break
+            if clique:
+                return False
+        return True
+    return check
+
+
+# =============================================================================
+def bipartite(g):
+    """Hereditary: True if the vertices of g can be 2-colored."""
+    color = {}
+    for root in g:
+        if root in color:
+            continue
+        color[root] = 0
+        queue = [root]
+        for v in queue:
+            for u in g[v]:
+                if u not in color:
+                    color[u] = 1 - color[v]
+                    queue.append(u)
+                elif color[u] == color[v]:
+                    return False
+    return True
+
+
+# =============================================================================
+def connected(g):
+    """Not hereditary: True if every vertex of g is reachable from every other."""
+    if len(g) == 0:
+        return True
+    root = next(iter(g))
+    seen = set([root])
+    queue = [root]
+    for v in queue:
+        for u in g[v]:
+            if u not in seen:
+                seen.add(u)
+                queue.append(u)
+    return len(seen) == len(g)
@@ -0,0 +1,283 @@
+"""
+Functions for choosing unlabeled graphs uniformly at random without
+enumerating them.
+
+This uses the method described in the paper:
+J. D. Dixon, H. S. Wilf, The Random Selection of Unlabeled Graphs, Journal of
+Algorithms 4 (1983) 205-213
+
+[A] Choose the cycle type p of a permutation of the vertices with probability
+    proportional to the number of graphs fixed by the permutations of that
+    type: cycle_type_size(p) times the number of graphs fixed by one of them.
+
+[B] Choose uniformly one of the graphs fixed by a permutation of type p. A
+    graph is fixed exactly when each cycle of the permutation acting on pairs
+    of vertices is either all edges or all non-edges, so this amounts to
+    choosing a set of pair cycles.
+
+By Burnside's lemma every isomorphism class is then equally likely. For all
+edge counts a permutation fixes 2^(number of pair cycles) graphs. For m edges
+it fixes as many graphs as there are sets of pair cycles covering m pairs,
+which is counted by a small dynamic program over the cycle lengths.
+
+The tables for n vertices are built on first use and kept for later calls.
+The first call for a given n and edge count weighs every cycle type of n,
+which takes seconds for large n (about 3s for n=30, which has 5604 cycle
+types); later calls with the same n and edge count take milliseconds.
+"""
+
+import bisect
+import random
+import combin
+import graph
+import orderly
+
+# Samples with a given edge count are first tried by rejecting samples over
+# all edge counts, which needs no table. This many are tried before using
+# the (exact, but for large n slow to build) table for that edge count.
+REJECTION_ATTEMPTS = 64
+
+# vertices -> (cycle types, pair cycle lengths of each, cumulative weights)
+_types = {}
+
+# (vertices, cycle type index) -> dict which maps a length to the pair cycles of that length
+_orbits = {}
+
+# (vertices, edges) -> cumulative weights
+_weights = {}
+
+# (vertices, cycle type index, edges) -> table from '_ways'
+_ways_cache = {}
+
+
+# =============================================================================
+def _cycle_types(vertices):
+    """Returns the cycle types on n vertices, their pair cycle lengths and the cumulative weights over all edge counts"""
+    if vertices not in _types:
+        types = []
+        lengths = []
+        cumulative = []
+        total = 0
+        for p in combin.gen_partitions(vertices):
+            types.append(p)
+            lengths.append(combin.edge_orbits(p))
+            total += combin.cycle_type_size(p) * 2 ** sum(lengths[-1].values())
+            cumulative.append(total)
+        _types[vertices] = (types, lengths, cumulative)
+    return _types[vertices]
+
+
+def _pair_orbits(vertices, index):
+    """
+    Returns the cycles of pairs of a permutation with the given cycle type as
+    a dict which maps a cycle length to a list of cycles, each a list of pairs.
+    """
+    key = (vertices, index)
+    if key not in _orbits:
+        p = _cycle_types(vertices)[0][index]
+        sigma = {}
+        v = 1
+        for k in p:
+            for i in range(k):
+                sigma[v + i] = v + (i + 1) % k
+            v += k
+
+        seen = set()
+        orbits = {}
+        for pair in combin.k_combinations(range(1, vertices + 1), 2):
+            pair = (min(pair), max(pair))
+            orbit = []
+            while pair not in seen:
+                seen.add(pair)
+                orbit.append(pair)
+                a, b = sigma[pair[0]], sigma[pair[1]]
+                pair = (min(a, b), max(a, b))
+            if len(orbit) > 0:
+                orbits.setdefault(len(orbit), []).append(orbit)
+        _orbits[key] = orbits
+    return _orbits[key]
+
+
+def _ways(lengths, edges):
+    """
+    ways[t][s] is the number of ways to choose pair cycles among the first t
+    (in increasing order) lengths covering s pairs in total.
+
+    :param lengths: A dict which maps a cycle length to the number of cycles of that length
+    """
+    ways = [[1] + [0] * edges]
+    for length in sorted(lengths.keys()):
+        count = lengths[length]
+        prev = ways[-1]
+        cur = [0] * (edges + 1)
+        binom = 1
+        for k in range(min(count, edges / length) + 1):
+            shift = k * length
+            for s in range(edges + 1 - shift):
+                if prev[s]:
+                    cur[s + shift] += binom * prev[s]
+            binom = binom * (count - k) / (k + 1)
+        ways.append(cur)
+    return ways
+
+
+def _count(lengths, edges):
+    """
+    Returns ways[-1][edges] of '_ways' without building the table.
+
+    This is the coefficient of x^edges in the product of (1 + x^length)^count
+    over the cycle lengths. Every coefficient is a number of sets of pair
+    cycles, so it is below 2^bits with bits = 1 + the number of cycles, and
+    the polynomial can be packed into one integer with x = 2^bits. Python's
+    integer arithmetic then does the products.
+    """
+    bits = 1 + sum(lengths.values())
+    truncate = (1 << (bits * (edges + 1))) - 1
+    product = 1
+    for length in lengths:
+        if length <= edges:
+            product = (product * (1 + (1 << (bits * length))) ** lengths[length]) & truncate
+    return (product >> (bits * edges)) & ((1 << bits) - 1)
+
+
+def _cached_ways(vertices, index, edges):
+    key = (vertices, index, edges)
+    if key not in _ways_cache:
+        _ways_cache[key] = _ways(_cycle_types(vertices)[1][index], edges)
+    return _ways_cache[key]
+
+
+def _edge_weights(vertices, edges):
+    """Returns the cumulative weights of the cycle types for graphs with the given number of edges"""
+    key = (vertices, edges)
+    if key not in _weights:
+        types, lengths, _ = _cycle_types(vertices)
+        cumulative = []
+        total = 0
+        for i in range(len(types)):
+            total += combin.cycle_type_size(types[i]) * _count(lengths[i], edges)
+            cumulative.append(total)
+        _weights[key] = cumulative
+    return _weights[key]
+
+
+def _choose(cumulative, rng):
+    """Returns an index chosen with probability proportional to its weight"""
+    return bisect.bisect_right(cumulative, rng.randrange(cumulative[-1]))
+
+
+def _build(vertices, orbits):
+    """Returns the graph whose edges are the pairs in the given cycles"""
+    g = {}
+    for i in range(1, vertices + 1, 1):
+        g[i] = []
+    for orbit in orbits:
+        for pair in orbit:
+            g[pair[0]].append(pair[1])
+            g[pair[1]].append(pair[0])
+    for v in g:
+        g[v].sort()
+    return g
+
+
+# =============================================================================
+def _sample_any(vertices, rng):
+    """Returns the chosen pair cycles of a uniformly chosen class over all edge counts"""
+    index = _choose(_cycle_types(vertices)[2], rng)
+    chosen = []
+    orbits = _pair_orbits(vertices, index)
+    for length in sorted(orbits.keys()):
+        for orbit in orbits[length]:
+            if rng.getrandbits(1):
+                chosen.append(orbit)
+    return chosen
+
+
+def _sample_edges(vertices, edges, rng):
+    """Returns the chosen pair cycles of a uniformly chosen class with the given number of edges"""
+    # Conditioned on its edge count a sample over all edge counts is uniform,
+    # so an accepted sample is as good as one from the table. The attempts are
+    # made whether or not the table is cached, so that a seed always consumes
+    # the same random numbers.
+    for attempt in range(REJECTION_ATTEMPTS):
+        chosen = _sample_any(vertices, rng)
+        if sum(len(orbit) for orbit in chosen) == edges:
+            return chosen
+
+    index = _choose(_edge_weights(vertices, edges), rng)
+    lengths = _cycle_types(vertices)[1][index]
+    orbits = _pair_orbits(vertices, index)
+    ways = _cached_ways(vertices, index, edges)
+
+    # walk back through the table choosing how many cycles of each length to use
+    chosen = []
+    s = edges
+    order = sorted(lengths.keys())
+    for t in range(len(order), 0, -1):
+        length = order[t - 1]
+        count = lengths[length]
+        r = rng.randrange(ways[t][s])
+        k = 0
+        binom = 1
+        while True:
+            w = binom * ways[t - 1][s - k * length]
+            if r < w:
+                break
+            r -= w
+            binom = binom * (count - k) / (k + 1)
+            k += 1
+        chosen += rng.sample(orbits[length], k)
+        s -= k * length
+    return chosen
+
+
+# =============================================================================
+def sample_batch(vertices, count, edges=None, seed=None, canonical=False):
+    """
+    Returns a list of graphs, each drawn independently and uniformly at random
+    from the unlabeled graphs on the given number of vertices.
+
+    :param vertices: The number of vertices in the graphs.
+
+    :param count: The number of graphs to draw.
+
+    :param edges: Optional number of edges. If given, only graphs with this many edges are drawn.
+
+    :param seed: Optional seed (or random.Random instance) which makes the draws reproducible.
+
+    :param canonical: If True, relabel each graph with 'orderly.canonical_form'. Only practical for small graphs.
+
+    :return: A list of dicts which map vertex numbers to adjacency lists.
+    """
+    if vertices < 1:
+        raise ValueError("Number of vertices must be positive: " + str(vertices))
+    complete = vertices * (vertices - 1) / 2
+    if edges is not None and (edges < 0 or edges > complete):
+        raise ValueError("Number of edges out of range: " + str(edges))
+
+    if isinstance(seed, random.Random):
+        rng = seed
+    else:
+        rng = random.Random(seed)
+
+    graphs = []
+    for i in range(count):
+        if edges is None:
+            g = _build(vertices, _sample_any(vertices, rng))
+        elif 2 * edges > complete:
+            # complementing is a bijection between the classes with m and complete - m edges
+            g = graph.complement(_build(vertices, _sample_edges(vertices, complete - edges, rng)))
+        else:
+            g = _build(vertices, _sample_edges(vertices, edges, rng))
+        if canonical:
+            g = orderly.canonical_form(g)
+        graphs.append(g)
+    return graphs
+
+
+def sample(vertices, edges=None, seed=None, canonical=False):
+    """
+    Returns a graph drawn uniformly at random from the unlabeled graphs on the
+    given number of vertices. See 'sample_batch'.
+    """
+    return sample_batch(vertices, 1, edges=edges, seed=seed, canonical=canonical)[0]
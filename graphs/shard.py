@@ -0,0 +1,144 @@
+"""
+Functions for splitting an enumeration into independent shards.
+
+A run over n vertices is split at a chosen layer (edge count). Every shard
+generates the layers below it with 'unlabeled_by_edge_count', then keeps only
+the graphs of the chosen layer whose index i satisfies i % count == index and
+generates the subtrees above them with 'orderly.unlabeled_from'. Shard 0 also
+outputs the layers below the split. No two shards share a graph and the union
+of all shards is the whole catalog, so shards can run on any machine in any
+order with no coordination.
+
+Each shard writes one record per graph:
+
+    <edges> <code> <graph>
+
+Within a shard the records are sorted by increasing edge count and decreasing
+code, which is the order of 'unlabeled'. 'merge' interleaves the shard outputs
+back into that order.
+"""
+
+import heapq
+import os
+import graph
+import orderly
+
+
+# =============================================================================
+def parse_shard(spec):
+    """
+    Parses a shard specification of the form 'i/K'
+
+    :return: The tuple (i, K)
+    """
+    parts = spec.split('/')
+    if len(parts) != 2:
+        raise ValueError("Invalid shard specification: " + spec)
+    index, count = int(parts[0]), int(parts[1])
+    if count < 1 or index < 0 or index >= count:
+        raise ValueError("Invalid shard specification: " + spec)
+    return index, count
+
+
+# =============================================================================
+def shard(vertices, index, count, layer, start=None, hereditary=None):
+    """
+    A generator which yields the graphs of one shard as one list per edge count, like 'unlabeled_by_edge_count'.
+
+    :param vertices: The number of vertices for which to generate unlabeled graphs over.
+
+    :param index: The number of this shard, 0 <= index < count
+
+    :param count: The total number of shards
+
+    :param layer: The edge count whose graphs are dealt out to the shards
+
+    :param start: Optional list previously yielded by this generator (see 'load_checkpoint'). Generation resumes
+    with the list after it.
+
+    :param hereditary: Optional property which is preserved under edge removal, see 'orderly.unlabeled'
+    """
+    if start is None:
+        layers = orderly.unlabeled_by_edge_count(vertices, hereditary=hereditary)
+    else:
+        layers = orderly.unlabeled_from(start, hereditary=hereditary)
+        next(layers)
+        if graph.edgecount(start[0]) >= layer:
+            # start already belongs to this shard's subtrees
+            for Lm in layers:
+                yield Lm
+            return
+
+    for Lm in layers:
+        if graph.edgecount(Lm[0]) < layer:
+            if index == 0:
+                yield Lm
+            continue
+        roots = Lm[index::count]
+        if len(roots) > 0:
+            for L in orderly.unlabeled_from(roots, hereditary=hereditary):
+                yield L
+        return
+
+
+# =============================================================================
+def record(g):
+    """Returns the output record for the graph g"""
+    return "%d %d %s" % (graph.edgecount(g), orderly.code(g), g)
+
+
+def record_key(line):
+    """Returns the sort key of an output record: edge count ascending, code descending"""
+    parts = line.split(' ', 2)
+    return int(parts[0]), -int(parts[1])
+
+
+def merge(streams):
+    """
+    A generator which merges the records of several shards into the order of 'unlabeled'.
+
+    :param streams: Iterables of records (e.g. open shard output files), each in shard order
+    """
+
+    def keyed(stream):
+        for line in stream:
+            if line.strip():
+                yield record_key(line), line
+
+    for key, line in heapq.merge(*[keyed(s) for s in streams]):
+        yield line
+
+
+# =============================================================================
+def save_checkpoint(path, vertices, index, count, layer, offset, Lm):
+    """
+    Records that every list up to and including Lm has been written to a shard's output, which was offset bytes
+    long afterwards. The file is replaced atomically so an interrupted save leaves the previous checkpoint intact.
+    """
+    tmp = path + ".tmp"
+    f = open(tmp, 'w')
+    f.write("%d %d %d %d\n" % (vertices, index, count, layer))
+    f.write("%d\n" % offset)
+    for g in Lm:
+        f.write("%d\n" % orderly.code(g))
+    f.flush()
+    os.fsync(f.fileno())
+    f.close()
+    os.rename(tmp, path)
+
+
+def load_checkpoint(path, vertices, index, count, layer):
+    """
+    Reads a checkpoint written by 'save_checkpoint'
+
+    :return: The tuple (offset, Lm) where Lm can be passed as the start argument of 'shard'
+    """
+    f = open(path)
+    header = f.readline().split()
+    if [int(x) for x in header] != [vertices, index, count, layer]:
+        f.close()
+        raise ValueError("Checkpoint " + path + " belongs to a different run")
+    offset = int(f.readline())
+    Lm = [orderly.decode(vertices, int(line)) for line in f if line.strip()]
+    f.close()
+    return offset, Lm
@@ -0,0 +1,102 @@
+"""
+Precomputed tables for computing codes under vertex permutations.
+
+For n vertices the tables hold:
+
+[Pairs] the pairs of vertex positions (i, j), i < j, in the order of the bits
+    of 'orderly.code', most significant first.
+
+[Shifts] shift[i][j] is the bit position (counted from the least
+    significant bit) of the pair (i, j), so a code is the sum of
+    1 << shift[i][j] over the edges.
+
+[Maps] for every permutation of the n positions, an array which maps the
+    index of a pair in the original labelling to the bit position the pair
+    moves to under the permutation. The code of a graph under that
+    permutation is then a gather: the sum of 1 << map[e] over its edges e.
+    There are n! of these, so they are only built for n <= LIMIT.
+
+Tables are built on first use and kept for the rest of the process. The maps
+can be saved to and loaded from numpy .npy files when numpy is installed.
+"""
+
+from array import array
+import combin
+
+# Largest number of vertices for which the permutation maps are built
+LIMIT = 8
+
+# vertices -> (pairs, shifts)
+_pairs = {}
+
+# vertices -> list of arrays, one per permutation
+_maps = {}
+
+
+# =============================================================================
+def pairs(n):
+    """Returns the list of position pairs of n vertices in code order and the table of their bit positions"""
+    if n not in _pairs:
+        plist = []
+        shifts = [[None] * n for i in range(n)]
+        bit = n * (n - 1) / 2
+        for i in range(n):
+            for j in range(i + 1, n):
+                bit -= 1
+                plist.append((i, j))
+                shifts[i][j] = bit
+                shifts[j][i] = bit
+        _pairs[n] = (plist, shifts)
+    return _pairs[n]
+
+
+def permutation_maps(n):
+    """
+    Returns one array per permutation of n positions which maps a pair index
+    to its bit position under the permutation.
+    """
+    if n > LIMIT:
+        raise ValueError("Permutation maps are only built for up to " + str(LIMIT) + " vertices")
+    if n not in _maps:
+        plist, shifts = pairs(n)
+        maps = []
+        for perm in combin.all_permutations(range(n)):
+            # the vertex at position perm[i] moves to position i
+            where = [0] * n
+            for i in range(n):
+                where[perm[i]] = i
+            maps.append(array('B', [shifts[where[a]][where[b]] for (a, b) in plist]))
+        _maps[n] = maps
+    return _maps[n]
+
+
+def _numpy():
+    """Imports numpy on first use, since importing it takes far longer than everything else here. None if missing."""
+    try:
+        import numpy
+    except ImportError:
+        print("numpy not installed. Please install to use this function")
+        return None
+    return numpy
+
+
+# =============================================================================
+def save(n, path):
+    """Saves the permutation maps of n vertices as an .npy file"""
+    numpy = _numpy()
+    if numpy is None:
+        return False
+    numpy.save(path, numpy.array([m.tolist() for m in permutation_maps(n)], dtype=numpy.uint8))
+    return True
+
+
+def load(n, path):
+    """Loads the permutation maps of n vertices from an .npy file written by save"""
+    numpy = _numpy()
+    if numpy is None:
+        return False
+    rows = numpy.load(path)
+    if rows.shape != (combin.factorial(n), n * (n - 1) / 2):
+        raise ValueError("Table file " + path + " is not for " + str(n) + " vertices")
+    _maps[n] = [array('B', row.tolist()) for row in rows]
+    return True
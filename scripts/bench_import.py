@@ -0,0 +1,68 @@
+#!/bin/usr/env python
+
+"""
+Benchmarks the start-up time of genum.
+
+Each case is run in a fresh interpreter several times and the median wall
+time is reported next to that of an empty interpreter, so the difference is
+the cost of the imports (and, for the last case, of a whole 'genum -n 4').
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+CASES = [
+    ('python', 'pass'),
+    ('import graphs.orderly', 'import graphs.orderly'),
+    ('import scripts.main', 'import scripts.main'),
+    ('genum -n 4', 'import sys; sys.argv = ["genum", "-n", "4"]; import scripts.main; scripts.main.main()'),
+]
+
+def setupArgs():
+    """Set up command line arguments"""
+    parser = argparse.ArgumentParser(description='Measures the cold start time of genum')
+
+    parser.add_argument('--runs', '-r', default=21, type=int,
+                        help='Number of runs of each case', dest='runs', metavar='<runs>')
+    parser.add_argument('--limit', default=None, type=float,
+                        help='Fail if genum -n 4 takes longer than this many milliseconds', dest='limit',
+                        metavar='<ms>')
+    return parser
+
+def median(code, runs, env):
+    """Returns the median wall time in seconds of running code in a new interpreter"""
+    devnull = open(os.devnull, 'w')
+    times = []
+    for i in range(runs):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', code], stdout=devnull, stderr=devnull, env=env)
+        times.append(time.time() - start)
+    devnull.close()
+    times.sort()
+    return times[len(times) / 2]
+
+def main():
+    args = setupArgs().parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = root + os.pathsep + env.get('PYTHONPATH', '')
+
+    base = None
+    for name, code in CASES:
+        t = median(code, args.runs, env)
+        if base is None:
+            base = t
+            print '%-24s %7.1f ms' % (name, t * 1000)
+        else:
+            print '%-24s %7.1f ms  (+%.1f ms)' % (name, t * 1000, (t - base) * 1000)
+
+    if args.limit is not None and t * 1000 > args.limit:
+        print 'genum -n 4 took %.1f ms, over the limit of %.1f ms' % (t * 1000, args.limit)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
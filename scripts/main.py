@@ -2,28 +2,150 @@
 
 """Primary script for testing"""
 
-from graphs.orderly import *
+# Only what every run needs is imported here. genum is started thousands of
+# times for small n, so argparse and the modules of the optional modes are
+# imported when they are used (see bench_import.py).
+from graphs.orderly import unlabeled_complement
+from graphs import formats
+import pipeline
 import sys
-import argparse
+
+# Edge count dealt out to the shards when --layer is not given
+SHARD_LAYER = 5
+
+def coreArgs(argv):
+    """
+    Returns the number of vertices if the command line asks for nothing but
+    the default output of some number of vertices, otherwise None.
+    """
+    if len(argv) == 0:
+        return 4
+    if len(argv) == 2 and argv[0] in ('-n', '--vertices') and argv[1].isdigit():
+        return int(argv[1])
+    if len(argv) == 1:
+        for prefix in ('-n', '--vertices='):
+            if argv[0].startswith(prefix) and argv[0][len(prefix):].isdigit():
+                return int(argv[0][len(prefix):])
+    return None
+
+def writeGraphs(vertices, encoding='text', path=None, sock=None, batch_size=pipeline.BATCH_SIZE):
+    """Streams the graphs over the given number of vertices to the output through the pipeline"""
+    out = pipeline.openOutput(path, sock)
+    try:
+        pipeline.run(unlabeled_complement(vertices), formats.ENCODERS[encoding], out, batch_size=batch_size)
+    finally:
+        out.close()
 
 def setupArgs():
     """Set up command line arguments"""
+    import argparse
+
     parser = argparse.ArgumentParser(description='Program for generating unlabeled graphs over n vertices')
 
     parser.add_argument('--vertices', '-n', default=4,
                         type=int, help='Max number of vertices', dest='vertices',
                         metavar='<max vertices>')
+    parser.add_argument('--shard', default=None,
+                        help='Only generate shard i of K, writing sortable records (see genum-merge)',
+                        dest='shard', metavar='<i/K>')
+    parser.add_argument('--layer', default=None, type=int,
+                        help='Edge count whose graphs are dealt out to the shards (default %d)' % SHARD_LAYER,
+                        dest='layer', metavar='<edges>')
+    parser.add_argument('--output', '-o', default=None,
+                        help='Write to a file instead of stdout', dest='output', metavar='<file>')
+    parser.add_argument('--resume', action='store_true', default=False,
+                        help='Continue an interrupted shard from the checkpoint next to --output', dest='resume')
+    parser.add_argument('--format', '-f', default=None, choices=sorted(formats.ENCODERS.keys()),
+                        help='Output encoding (default text)', dest='format')
+    parser.add_argument('--socket', default=None,
+                        help='Write to a local (unix domain) socket instead of stdout', dest='socket',
+                        metavar='<path>')
+    parser.add_argument('--batch', default=None, type=int,
+                        help='Number of graphs encoded and written at a time (default %d)' % pipeline.BATCH_SIZE,
+                        dest='batch', metavar='<graphs>')
+    parser.add_argument('--index', default=None,
+                        help='Write the rank/unrank index of the catalog to a file instead', dest='index',
+                        metavar='<file>')
     return parser
 
+def runShard(args):
+    """Generates a single shard, checkpointing after every layer when writing to a file"""
+    from graphs import shard
+    import os
+
+    index, count = shard.parse_shard(args.shard)
+    if args.layer is None:
+        args.layer = SHARD_LAYER
+    start = None
+
+    if args.output is None:
+        out = sys.stdout
+        checkpoint = None
+    else:
+        checkpoint = args.output + '.ckpt'
+        if args.resume and os.path.exists(checkpoint):
+            offset, start = shard.load_checkpoint(checkpoint, args.vertices, index, count, args.layer)
+            out = open(args.output, 'r+')
+            out.truncate(offset)
+            out.seek(offset)
+        else:
+            out = open(args.output, 'w')
+
+    for Lm in shard.shard(args.vertices, index, count, args.layer, start=start):
+        for g in Lm:
+            out.write(shard.record(g) + '\n')
+        out.flush()
+        if checkpoint is not None:
+            os.fsync(out.fileno())
+            shard.save_checkpoint(checkpoint, args.vertices, index, count, args.layer, out.tell(), Lm)
+
+    if out is not sys.stdout:
+        out.close()
+
+def checkArgs(parser, args):
+    """Rejects options which the selected mode would ignore"""
+    if args.index is not None and args.shard is not None:
+        parser.error('--index and --shard cannot be combined')
+    if args.index is not None or args.shard is not None:
+        mode = '--index' if args.index is not None else '--shard'
+        for name, value in (('--format', args.format), ('--socket', args.socket), ('--batch', args.batch)):
+            if value is not None:
+                parser.error(name + ' cannot be used with ' + mode)
+    if args.index is not None and args.output is not None:
+        parser.error('--output cannot be used with --index')
+    if args.shard is None:
+        for name, value in (('--layer', args.layer), ('--resume', args.resume or None)):
+            if value is not None:
+                parser.error(name + ' can only be used with --shard')
+    if args.resume and args.output is None:
+        parser.error('--resume needs --output, next to which the checkpoint is kept')
+    if args.output is not None and args.socket is not None:
+        parser.error('--output and --socket cannot be combined')
+    if args.batch is not None and args.batch < 1:
+        parser.error('--batch must be positive')
+
 def main():
-    args = setupArgs().parse_args()
+    vertices = coreArgs(sys.argv[1:])
+    if vertices is not None:
+        # the same output as below, only without parsing the arguments
+        writeGraphs(vertices)
+        return
+
+    parser = setupArgs()
+    args = parser.parse_args()
+    checkArgs(parser, args)
     vertices = args.vertices
 
-    g = unlabeled_complement(vertices)
+    if args.index is not None:
+        from graphs import catalog
+        catalog.build_index(vertices, args.index)
+        return
+
+    if args.shard is not None:
+        runShard(args)
+        return
 
-    for i in g:
-        print i
+    writeGraphs(vertices, args.format or 'text', args.output, args.socket, args.batch or pipeline.BATCH_SIZE)
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,33 @@
+#!/bin/usr/env python
+
+"""Merges the outputs of 'genum --shard' runs into the order of a single run"""
+
+from graphs import shard
+import sys
+import argparse
+
+def setupArgs():
+    """Set up command line arguments"""
+    parser = argparse.ArgumentParser(description='Merges genum shard outputs into canonical order')
+
+    parser.add_argument('shards', nargs='+', help='Shard output files', metavar='<shard file>')
+    parser.add_argument('--output', '-o', default=None,
+                        help='Write to a file instead of stdout', dest='output', metavar='<file>')
+    return parser
+
+def main():
+    args = setupArgs().parse_args()
+
+    streams = [open(path) for path in args.shards]
+    out = sys.stdout if args.output is None else open(args.output, 'w')
+
+    for line in shard.merge(streams):
+        out.write(line)
+
+    for s in streams:
+        s.close()
+    if out is not sys.stdout:
+        out.close()
+
+if __name__ == "__main__":
+    main()
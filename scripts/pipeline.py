@@ -0,0 +1,111 @@
+#!/bin/usr/env python
+
+"""
+Streams generated graphs to an output without stalling the generator.
+
+The calling thread runs the generator and encodes the graphs in batches.
+Each batch is handed over through a bounded queue to a writer thread, which
+does large buffered writes and blocks on slow outputs without holding up the
+generator. When the output is slower than the generator the queue fills up
+and the generator waits, so no more than queue_size batches are ever held.
+
+The generator stays on the calling (main) thread because python 2 only
+handles Ctrl-C there, and a CPU bound generator on another thread keeps the
+main thread from ever getting to it.
+"""
+
+import os
+import sys
+import threading
+import Queue
+
+# Batches handed to the writer hold this many graphs
+BATCH_SIZE = 1024
+
+# At most this many encoded batches wait for the writer
+QUEUE_SIZE = 16
+
+# Size of the output buffer in bytes
+BUFFER_SIZE = 1 << 20
+
+
+def openOutput(path=None, sock=None, buffer_size=BUFFER_SIZE):
+    """Opens a buffered binary output: a file, a local (unix domain) socket or, by default, stdout"""
+    if sock is not None:
+        import socket
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        s.connect(sock)
+        out = s.makefile('wb', buffer_size)
+        s.close()
+        return out
+    if path is not None:
+        return open(path, 'wb', buffer_size)
+    return os.fdopen(os.dup(sys.stdout.fileno()), 'wb', buffer_size)
+
+
+def _consume(queue, out, stop, failure):
+    """Writer: writes queued batches until None is queued or the run is stopped"""
+    try:
+        while not stop.is_set():
+            try:
+                chunk = queue.get(timeout=0.1)
+            except Queue.Empty:
+                continue
+            if chunk is None:
+                out.flush()
+                return
+            out.write(chunk)
+    except Exception:
+        failure.append(sys.exc_info())
+        stop.set()
+
+
+def _put(queue, item, stop):
+    """Blocks until the item is queued, giving up if the writer has stopped"""
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Queue.Full:
+            pass
+    return False
+
+
+def run(graphs, encode, out, batch_size=BATCH_SIZE, queue_size=QUEUE_SIZE):
+    """
+    Writes every graph from the generator to out, generating on this thread while a writer thread writes.
+
+    :param graphs: An iterable of graphs, e.g. orderly.unlabeled(n)
+
+    :param encode: A function from a graph to its record, see graphs.formats
+
+    :param out: A file object opened for writing, see openOutput
+    """
+    queue = Queue.Queue(queue_size)
+    stop = threading.Event()
+    failure = []
+    writer = threading.Thread(target=_consume, args=(queue, out, stop, failure))
+    writer.daemon = True
+    writer.start()
+    try:
+        batch = []
+        for g in graphs:
+            batch.append(encode(g))
+            if len(batch) >= batch_size:
+                if not _put(queue, ''.join(batch), stop):
+                    break
+                batch = []
+        else:
+            if len(batch) > 0:
+                _put(queue, ''.join(batch), stop)
+            _put(queue, None, stop)
+            # a join without a timeout cannot be interrupted by Ctrl-C in python 2
+            while writer.is_alive():
+                writer.join(0.1)
+    finally:
+        # let the writer see stop before the interpreter tears down its modules
+        stop.set()
+        writer.join(1.0)
+    if failure:
+        exc_type, exc_value, tb = failure[0]
+        raise exc_type, exc_value, tb
@@ -19,9 +19,12 @@ setup(
 
     install_requires=['pillow>=2.9.0'],
 
+    extras_require={'tables': ['numpy']},
+
     entry_points={
         'console_scripts': [
             'genum=scripts.main:main',
+            'genum-merge=scripts.merge:main',
         ],
     },
 )
@@ -0,0 +1,56 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from graphs import catalog
+from graphs import orderly
+
+
+class TestCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'c5.idx')
+        catalog.build_index(5, self.path)
+        self.catalog = catalog.Catalog(self.path)
+        self.graphs = list(orderly.unlabeled(5))
+
+    def tearDown(self):
+        self.catalog.close()
+        shutil.rmtree(self.dir)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.catalog), len(self.graphs))
+        for k in range(len(self.graphs)):
+            self.assertEqual(catalog.unrank(5, k, self.catalog), self.graphs[k])
+            self.assertEqual(catalog.rank(self.graphs[k], self.catalog), k)
+
+    def test_rank_relabelled(self):
+        rng = random.Random(0)
+        for k in range(len(self.graphs)):
+            perm = range(1, 6)
+            rng.shuffle(perm)
+            g = self.graphs[k]
+            h = dict((perm[v - 1], [perm[u - 1] for u in g[v]]) for v in g)
+            self.assertEqual(catalog.rank(h, self.catalog), k)
+
+    def test_out_of_range(self):
+        self.assertRaises(IndexError, catalog.unrank, 5, len(self.graphs), self.catalog)
+        self.assertRaises(ValueError, catalog.unrank, 4, 0, self.catalog)
+
+    def test_rebuild_by_path(self):
+        path = os.path.join(self.dir, 'rebuilt.idx')
+        catalog.build_index(5, path)
+        self.assertEqual(catalog.unrank(5, 3, path), self.graphs[3])
+        # rebuilding the same path for other vertices must not reuse the catalog opened above
+        catalog.build_index(4, path)
+        graphs = list(orderly.unlabeled(4))
+        self.assertEqual(catalog.unrank(4, 3, path), graphs[3])
+        self.assertEqual(catalog.rank(graphs[-1], path), len(graphs) - 1)
+        catalog._open.pop(path).close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from graphs import formats
+from graphs import graph
+from graphs import orderly
+
+
+class TestComplement(unittest.TestCase):
+
+    def test_same_classes_as_unlabeled(self):
+        for n in range(2, 7):
+            codes = [orderly.code(g) for g in orderly.unlabeled(n)]
+            complement = list(orderly.unlabeled_complement(n))
+            self.assertEqual(sorted([orderly.code(g) for g in complement]), sorted(codes))
+
+    def test_views_are_canonical(self):
+        for g in orderly.unlabeled_complement(6):
+            if isinstance(g, graph.ComplementView):
+                self.assertTrue(orderly.is_canonical(g.materialize()))
+                self.assertEqual(orderly.code(g), orderly.code(g.materialize()))
+
+    def test_code_is_canonical_correction(self):
+        g = {1: [2], 2: [1], 3: []}
+        view = graph.ComplementView(3, min(orderly.all_codes(g)))
+        self.assertEqual(orderly.code(view), 6)
+        self.assertEqual(view.materialize(), orderly.canonical_form(graph.complement(g)))
+
+    def test_adjacency_is_read_only(self):
+        view = graph.ComplementView(4, 0)
+        self.assertEqual(view[1], (2, 3, 4))
+        self.assertRaises(AttributeError, getattr, view[1], 'append')
+        self.assertRaises(KeyError, view.__getitem__, 5)
+
+    def test_encodings_match_materialized(self):
+        for g in orderly.unlabeled_complement(5):
+            if isinstance(g, graph.ComplementView):
+                h = g.materialize()
+                self.assertEqual(formats.text(g), formats.text(h))
+                self.assertEqual(formats.graph6(g), formats.graph6(h))
+                self.assertEqual(formats.binary(g), formats.binary(h))
+                self.assertEqual(graph.edgecount(g), graph.edgecount(h))
+
+
+if __name__ == '__main__':
+    unittest.main()
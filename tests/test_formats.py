@@ -0,0 +1,50 @@
+import unittest
+
+from graphs import formats
+from graphs import graph
+
+PATH = {1: [2], 2: [1, 3], 3: [2]}
+TRIANGLE = {1: [2, 3], 2: [1, 3], 3: [1, 2]}
+
+# the labelling of the Petersen graph for which nauty writes 'IheA@GUAo'
+PETERSEN_EDGES = [(0, 1), (0, 4), (0, 5), (1, 2), (1, 6), (2, 3), (2, 7), (3, 4), (3, 8), (4, 9),
+                  (5, 7), (5, 8), (6, 8), (6, 9), (7, 9)]
+
+
+def from_edges(vertices, edges):
+    g = dict((v, []) for v in range(1, vertices + 1))
+    for a, b in edges:
+        g[a + 1].append(b + 1)
+        g[b + 1].append(a + 1)
+    return g
+
+
+class TestFormats(unittest.TestCase):
+
+    def test_text(self):
+        self.assertEqual(formats.text(PATH), '{1: [2], 2: [1, 3], 3: [2]}\n')
+
+    def test_graph6(self):
+        self.assertEqual(formats.graph6({1: []}), '@\n')
+        self.assertEqual(formats.graph6(PATH), 'Bg\n')
+        self.assertEqual(formats.graph6(TRIANGLE), 'Bw\n')
+        self.assertEqual(formats.graph6(graph.ComplementView(3, 0)), 'Bw\n')
+        self.assertEqual(formats.graph6(from_edges(10, PETERSEN_EDGES)), 'IheA@GUAo\n')
+
+    def test_graph6_large(self):
+        # 63 vertices take the long size header; 63 * 62 / 2 bits make 326 characters
+        empty = from_edges(63, [])
+        self.assertEqual(formats.graph6(empty), '~??~' + '?' * 326 + '\n')
+
+    def test_binary(self):
+        self.assertEqual(formats.binary({1: []}), '\x00')
+        self.assertEqual(formats.binary(PATH), '\x05')
+        self.assertEqual(formats.binary(TRIANGLE), '\x07')
+        # 15 bits take two bytes
+        complete = from_edges(6, [(a, b) for a in range(6) for b in range(a + 1, 6)])
+        self.assertEqual(formats.binary(complete), '\x7f\xff')
+        self.assertEqual(formats.binary(graph.ComplementView(6, 0)), '\x7f\xff')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import StringIO
+import sys
+import threading
+import time
+import unittest
+
+from graphs import formats
+from graphs import orderly
+from scripts import main
+from scripts import pipeline
+
+
+class Broken:
+    "An output whose writes fail"
+
+    def write(self, data):
+        raise IOError("output closed")
+
+    def flush(self):
+        pass
+
+
+class Slow:
+    "An output whose writes wait until it is released"
+
+    def __init__(self):
+        self.released = threading.Event()
+        self.chunks = []
+
+    def write(self, data):
+        self.released.wait()
+        self.chunks.append(data)
+
+    def flush(self):
+        pass
+
+
+class TestRun(unittest.TestCase):
+
+    def test_same_as_sequential(self):
+        graphs = list(orderly.unlabeled(6))
+        for name in sorted(formats.ENCODERS.keys()):
+            encode = formats.ENCODERS[name]
+            expected = ''.join([encode(g) for g in graphs])
+            for batch_size in (1, 7, 1024):
+                out = StringIO.StringIO()
+                pipeline.run(iter(graphs), encode, out, batch_size=batch_size, queue_size=2)
+                self.assertEqual(out.getvalue(), expected, name)
+
+    def test_writer_failure(self):
+        pulled = []
+
+        def endless():
+            while True:
+                pulled.append(None)
+                yield {1: []}
+
+        self.assertRaises(IOError, pipeline.run, endless(), formats.text, Broken(), batch_size=10, queue_size=2)
+        # generation stopped soon after the writer failed
+        self.assertTrue(len(pulled) <= 10 * 4, len(pulled))
+
+    def test_bounded_queue(self):
+        pulled = []
+
+        def graphs():
+            for i in range(10000):
+                pulled.append(i)
+                yield {1: []}
+
+        out = Slow()
+        producer = threading.Thread(target=pipeline.run, args=(graphs(), formats.text, out),
+                                    kwargs={'batch_size': 10, 'queue_size': 2})
+        producer.start()
+        time.sleep(0.5)
+        # at most: the batch being written, the queued batches and the batch being encoded
+        self.assertTrue(len(pulled) <= 10 * (1 + 2 + 1) + 1, len(pulled))
+        out.released.set()
+        producer.join()
+        self.assertEqual(len(pulled), 10000)
+        self.assertEqual(''.join(out.chunks), formats.text({1: []}) * 10000)
+
+
+class TestCheckArgs(unittest.TestCase):
+
+    def setUp(self):
+        # argparse reports errors on stderr
+        self.stderr = sys.stderr
+        sys.stderr = StringIO.StringIO()
+
+    def tearDown(self):
+        sys.stderr = self.stderr
+
+    def check(self, argv):
+        parser = main.setupArgs()
+        args = parser.parse_args(argv)
+        main.checkArgs(parser, args)
+        return args
+
+    def test_accepted(self):
+        for argv in (['-n', '5'], ['-n', '5', '-f', 'graph6', '--batch', '3'], ['-n', '5', '--socket', 's'],
+                     ['-n', '5', '--shard', '0/3', '--layer', '4'], ['-n', '5', '--shard', '0/3', '-o', 'f', '--resume'],
+                     ['-n', '5', '--index', 'i']):
+            self.check(argv)
+
+    def test_rejected(self):
+        for argv in (['--index', 'i', '--shard', '0/3'],
+                     ['--shard', '0/3', '-f', 'text'], ['--shard', '0/3', '--socket', 's'], ['--shard', '0/3', '--batch', '3'],
+                     ['--index', 'i', '-f', 'binary'], ['--index', 'i', '--socket', 's'], ['--index', 'i', '--batch', '3'],
+                     ['--index', 'i', '-o', 'f'],
+                     ['--layer', '4'], ['-o', 'f', '--resume'],
+                     ['--shard', '0/3', '--resume'],
+                     ['-o', 'f', '--socket', 's'],
+                     ['--batch', '0']):
+            self.assertRaises(SystemExit, self.check, ['-n', '5'] + argv)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+from graphs import orderly
+from graphs import properties
+
+N = 6
+
+HEREDITARY = [
+    ('max_degree(2)', properties.max_degree(2)),
+    ('max_degree(3)', properties.max_degree(3)),
+    ('triangle_free', properties.triangle_free),
+    ('bipartite', properties.bipartite),
+    ('min_girth(5)', properties.min_girth(5)),
+    ('acyclic', properties.acyclic),
+    ('max_clique(3)', properties.max_clique(3)),
+]
+
+
+def codes(graphs):
+    return [orderly.code(g) for g in graphs]
+
+
+def flatten(layers):
+    return [g for Lm in layers for g in Lm]
+
+
+def shortest_cycle(g):
+    """The girth by removing each edge in turn and finding the shortest path between its ends"""
+    best = None
+    for v in g:
+        for u in g[v]:
+            if u < v:
+                continue
+            depth = {v: 0}
+            queue = [v]
+            for w in queue:
+                for x in g[w]:
+                    if (w, x) in ((v, u), (u, v)) or x in depth:
+                        continue
+                    depth[x] = depth[w] + 1
+                    queue.append(x)
+            if u in depth and (best is None or depth[u] + 1 < best):
+                best = depth[u] + 1
+    return best
+
+
+class TestProperties(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.graphs = list(orderly.unlabeled(N))
+
+    def filtered(self, *predicates):
+        return codes([g for g in self.graphs if all(p(g) for p in predicates)])
+
+    def test_hereditary_prunes_exactly(self):
+        for name, p in HEREDITARY:
+            expected = self.filtered(p)
+            self.assertEqual(codes(orderly.unlabeled(N, hereditary=p)), expected, name)
+            self.assertEqual(codes(flatten(orderly.unlabeled_by_edge_count(N, hereditary=p))), expected, name)
+
+    def test_emit(self):
+        expected = self.filtered(properties.connected)
+        self.assertEqual(codes(orderly.unlabeled(N, emit=properties.connected)), expected)
+        self.assertEqual(codes(flatten(orderly.unlabeled_by_edge_count(N, emit=properties.connected))), expected)
+
+    def test_hereditary_and_emit(self):
+        # connected forests are the trees
+        expected = self.filtered(properties.acyclic, properties.connected)
+        self.assertEqual(len(expected), 6)
+        self.assertEqual(codes(orderly.unlabeled(N, hereditary=properties.acyclic, emit=properties.connected)),
+                         expected)
+        layers = list(orderly.unlabeled_by_edge_count(N, hereditary=properties.acyclic, emit=properties.connected))
+        self.assertEqual(codes(flatten(layers)), expected)
+        # only the layer with n - 1 edges holds trees, the layers below are emitted empty
+        self.assertEqual([len(Lm) for Lm in layers], [0] * (N - 1) + [6])
+
+    def test_all_of(self):
+        p = properties.all_of(properties.triangle_free, properties.max_degree(2))
+        self.assertEqual(codes(orderly.unlabeled(N, hereditary=p)),
+                         self.filtered(properties.triangle_free, properties.max_degree(2)))
+
+    def test_max_degree_zero(self):
+        p = properties.max_degree(0)
+        self.assertEqual(list(orderly.unlabeled(N, hereditary=p)), [orderly.decode(N, 0)])
+        self.assertEqual(list(orderly.unlabeled_by_edge_count(N, hereditary=p)), [[orderly.decode(N, 0)]])
+
+    def test_empty_graph_rejected(self):
+        never = lambda g: False
+        self.assertEqual(list(orderly.unlabeled(N, hereditary=never)), [])
+        self.assertEqual(list(orderly.unlabeled_by_edge_count(N, hereditary=never)), [])
+
+    def test_girth(self):
+        for g in self.graphs:
+            self.assertEqual(properties.girth(g), shortest_cycle(g))
+
+
+if __name__ == '__main__':
+    unittest.main()
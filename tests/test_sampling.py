@@ -0,0 +1,50 @@
+import unittest
+
+from graphs import combin
+from graphs import graph
+from graphs import orderly
+from graphs import sampling
+
+
+class TestSampling(unittest.TestCase):
+
+    def test_same_seed_same_graphs(self):
+        for edges in (None, 5, 30):
+            first = sampling.sample(9, edges=edges, seed=1)
+            # the second call runs with every table already cached
+            self.assertEqual(sampling.sample(9, edges=edges, seed=1), first)
+            self.assertEqual(sampling.sample_batch(9, 5, edges=edges, seed=2),
+                             sampling.sample_batch(9, 5, edges=edges, seed=2))
+
+    def test_edge_count(self):
+        for edges in (0, 1, 7, 20, 36):
+            for g in sampling.sample_batch(9, 5, edges=edges, seed=edges):
+                self.assertEqual(graph.edgecount(g), edges)
+                self.assertEqual(sorted(g.keys()), range(1, 10))
+
+    def test_all_classes_drawn(self):
+        drawn = set(orderly.code(g) for g in sampling.sample_batch(4, 400, seed=3, canonical=True))
+        self.assertEqual(drawn, set(orderly.code(g) for g in orderly.unlabeled(4)))
+
+    def test_out_of_range(self):
+        self.assertRaises(ValueError, sampling.sample, 4, edges=7)
+        self.assertRaises(ValueError, sampling.sample, 0)
+
+    def test_num_isomorphism_classes(self):
+        self.assertEqual([combin.num_isomorphism_classes(n) for n in range(1, 9)],
+                         [1, 2, 4, 11, 34, 156, 1044, 12346])
+
+    def test_edge_weights(self):
+        for n in range(1, 9):
+            lengths = sampling._cycle_types(n)[1]
+            for edges in range(n * (n - 1) / 2 + 1):
+                for l in lengths:
+                    self.assertEqual(sampling._count(l, edges), sampling._ways(l, edges)[-1][edges])
+        # by Burnside's lemma the weights add up to n! times the number of classes
+        layers = [len(Lm) for Lm in orderly.unlabeled_by_edge_count(6)]
+        for edges in range(16):
+            self.assertEqual(sampling._edge_weights(6, edges)[-1], combin.factorial(6) * layers[edges])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import itertools
+import os
+import shutil
+import tempfile
+import unittest
+
+from graphs import orderly
+from graphs import shard
+
+
+def records(vertices, index, count, layer, start=None):
+    lines = []
+    for Lm in shard.shard(vertices, index, count, layer, start=start):
+        lines += [shard.record(g) + '\n' for g in Lm]
+    return lines
+
+
+class TestShard(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_unlabeled_from_empty_graph(self):
+        for n in range(1, 6):
+            self.assertEqual(list(orderly.unlabeled_from([orderly.decode(n, 0)])),
+                             list(orderly.unlabeled_by_edge_count(n)))
+
+    def test_merge_matches_unlabeled(self):
+        for n in (4, 5):
+            expected = [shard.record(g) + '\n' for g in orderly.unlabeled(n)]
+            for count in (1, 2, 3, 5):
+                for layer in (0, 2, 4, 20):
+                    parts = [records(n, i, count, layer) for i in range(count)]
+                    self.assertEqual(sum(len(p) for p in parts), len(expected))
+                    self.assertEqual(list(shard.merge(parts)), expected)
+
+    def test_parse_shard(self):
+        self.assertEqual(shard.parse_shard('2/5'), (2, 5))
+        for spec in ('5/5', '-1/3', '1', '1/0'):
+            self.assertRaises(ValueError, shard.parse_shard, spec)
+
+    def test_resume_from_checkpoint(self):
+        n, count, layer = 5, 3, 3
+        path = os.path.join(self.dir, 'ckpt')
+        for index in range(count):
+            full = records(n, index, count, layer)
+            # before the split (only shard 0 writes there) and after it
+            for done in (1, 2, 4):
+                written = []
+                Lm = None
+                for Lm in itertools.islice(shard.shard(n, index, count, layer), done):
+                    written += [shard.record(g) + '\n' for g in Lm]
+                if Lm is None:
+                    continue
+                shard.save_checkpoint(path, n, index, count, layer, len(''.join(written)), Lm)
+                offset, start = shard.load_checkpoint(path, n, index, count, layer)
+                self.assertEqual(offset, len(''.join(written)))
+                self.assertEqual(written + records(n, index, count, layer, start=start), full)
+
+    def test_checkpoint_from_other_run(self):
+        path = os.path.join(self.dir, 'ckpt')
+        shard.save_checkpoint(path, 5, 0, 3, 3, 0, [orderly.decode(5, 0)])
+        self.assertRaises(ValueError, shard.load_checkpoint, path, 5, 1, 3, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from graphs import combin
+from graphs import orderly
+from graphs import tables
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def string_code(g, permutation):
+    """The code as it was defined before the tables: the upper triangle read as a bit string"""
+    bits = ''
+    for i in range(len(permutation)):
+        for j in range(i + 1, len(permutation)):
+            bits += '1' if permutation[j] in g[permutation[i]] else '0'
+    return int('0' + bits, 2)
+
+
+def random_graph(vertices, rng, p=0.5):
+    g = dict((v, []) for v in range(1, vertices + 1))
+    for a in range(1, vertices + 1):
+        for b in range(a + 1, vertices + 1):
+            if rng.random() < p:
+                g[a].append(b)
+                g[b].append(a)
+    return g
+
+
+class TestCodes(unittest.TestCase):
+
+    def check(self, g):
+        perms = list(combin.all_permutations(g.keys()))
+        expected = [string_code(g, p) for p in perms]
+        self.assertEqual([orderly.code(g, p) for p in perms], expected)
+        # all_codes yields them in the order of all_permutations
+        self.assertEqual(list(orderly.all_codes(g)), expected)
+        self.assertEqual(orderly.is_canonical(g), expected[0] == max(expected))
+
+    def test_against_string_code(self):
+        rng = random.Random(0)
+        for n in range(1, 8):
+            for i in range(3):
+                self.check(random_graph(n, rng))
+
+    def test_above_limit(self):
+        # n = 9 takes the permutation by permutation path of all_codes
+        self.assertTrue(9 > tables.LIMIT)
+        self.check(random_graph(9, random.Random(1), p=0.2))
+
+    def test_canonical(self):
+        for g in orderly.unlabeled(5):
+            self.assertTrue(orderly.is_canonical(g))
+            self.assertEqual(orderly.canonical_form(g), g)
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestTables(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'maps.npy')
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_round_trip(self):
+        maps = [m.tolist() for m in tables.permutation_maps(4)]
+        tables.save(4, self.path)
+        tables._maps.pop(4)
+        self.assertTrue(tables.load(4, self.path))
+        self.assertEqual([m.tolist() for m in tables.permutation_maps(4)], maps)
+
+    def test_wrong_vertices(self):
+        tables.save(4, self.path)
+        self.assertRaises(ValueError, tables.load, 3, self.path)
+        self.assertRaises(ValueError, tables.load, 5, self.path)
+
+    def test_truncated(self):
+        numpy.save(self.path, numpy.array([m.tolist() for m in tables.permutation_maps(4)[:5]], dtype=numpy.uint8))
+        self.assertRaises(ValueError, tables.load, 4, self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()